@@ -8,10 +8,11 @@ from delta_inspect.cli.distribution import distribution_command
 app = typer.Typer(
     name="delta-inspect", 
     help="Inspect and analyze Delta Lake tables.",
-    no_args_is_help=True
+    no_args_is_help=True,
+    add_completion=False,
 )
 
-# Add subcommands
+# Add subcommands; heavy dependencies are imported lazily within each command
 app.command("summary")(summary_command)
 app.command("clustering")(clustering_command)
 app.command("distribution")(distribution_command)
@@ -1,12 +1,10 @@
 """CLI subcommand for Delta table clustering health functionality."""
 
 import typer
-from typing import Annotated
-from rich.console import Console
+from typing import TYPE_CHECKING, Annotated
 
-from delta_inspect.clustering.core import clustering_health
-from delta_inspect.clustering.model import Clustering
 from delta_inspect.util.cli import (
+    BufferedConsole,
     WIDTH_COL_FIRST,
     TableColumn,
     console_dist_histogram,
@@ -16,10 +14,13 @@ from delta_inspect.util.cli import (
     console_table,
 )
 
-console = Console()
+if TYPE_CHECKING:
+    from delta_inspect.clustering.model import Clustering
 
+__all__ = ["clustering_command"]
 
-def format_overlap_description(health: Clustering) -> str:
+
+def format_overlap_description(health: "Clustering") -> str:
     """Create a human-readable description of overlap statistics."""
     if health.max == 0:
         return "✅   Perfect clustering"
@@ -31,7 +32,7 @@ def format_overlap_description(health: Clustering) -> str:
         return "❌   Poor clustering"
 
 
-def console_overview(health: Clustering):
+def console_overview(console: BufferedConsole, health: "Clustering"):
     columns = [
         TableColumn(title="Metric", style="cyan", width=WIDTH_COL_FIRST),
         TableColumn(title="Value", style="white", width=30),
@@ -69,14 +70,22 @@ def clustering_command(
 ) -> None:
     """Analyze clustering health of a Delta Lake table for specified columns."""
 
-    if not columns:
-        err_msg = "At least one column must be specified using --columns/-c"
-        console.print(err_msg)
-        raise typer.Exit(1)
+    # deferred to keep `--help` and argument errors free of polars/deltalake/rtree
+    from delta_inspect.clustering.core import clustering_health
+
+    console = BufferedConsole()
+
+    try:
+        if not columns:
+            err_msg = "At least one column must be specified using --columns/-c"
+            console.write(err_msg)
+            raise typer.Exit(1)
 
-    console_header(console=console, title="Clustering Health")
+        console_header(console=console, title="Clustering Health")
 
-    health = clustering_health(path, columns)
-    console_overview(health)
-    console_dist_statistics(dist=health, metric="Overlaps", console=console)
-    console_dist_histogram(dist=health, metric="Overlaps", console=console)
+        health = clustering_health(path, columns)
+        console_overview(console=console, health=health)
+        console_dist_statistics(dist=health, metric="Overlaps", console=console)
+        console_dist_histogram(dist=health, metric="Overlaps", console=console)
+    finally:
+        console.flush()
@@ -1,22 +1,17 @@
-"""CLI subcommand for Delta table clustering health functionality."""
+"""CLI subcommand for Delta table distribution functionality."""
 
 import typer
 from typing import Annotated
-from rich.console import Console
 
-from delta_inspect.distribution.core import distribution
-from delta_inspect.distribution.model import Distribution, DistributionMetric, ItemDistribution
+from delta_inspect.distribution.metric import DistributionMetric
 from delta_inspect.util.cli import (
-    WIDTH_COL_FIRST,
-    TableColumn,
+    BufferedConsole,
     console_dist_histogram,
     console_dist_statistics,
     console_header,
-    format_number,
-    console_table,
 )
 
-console = Console()
+__all__ = ["distribution_command"]
 
 
 def distribution_command(
@@ -33,17 +28,30 @@ def distribution_command(
     """Analyze distribution of file sizes and partitions of a Delta 
     Lake table for specified columns."""
 
-    dist = distribution(path)
-    
-    console_header(console=console, title="Distribution Analysis - File Size")
-    console_dist_statistics(dist=dist.distribution_files, metric="Size in MiB", console=console)
-    console_dist_histogram(dist=dist.distribution_files, metric="Size in MiB", console=console)
+    # deferred to keep `--help` and argument errors free of polars
+    from delta_inspect.distribution.core import distribution
 
-    if dist.distribution_partitions:
-        console_header(console=console, title="Distribution Analysis - Partition Size")
+    console = BufferedConsole()
+    try:
+        console_header(console=console, title="Distribution Analysis - File Size")
+
+        dist = distribution(path)
         console_dist_statistics(
-            dist=dist.distribution_partitions, metric="Size in MiB", console=console
+            dist=dist.distribution_files, metric="Size in MiB", console=console
         )
         console_dist_histogram(
-            dist=dist.distribution_partitions, metric="Size in MiB", console=console
+            dist=dist.distribution_files, metric="Size in MiB", console=console
         )
+
+        if dist.distribution_partitions:
+            console_header(
+                console=console, title="Distribution Analysis - Partition Size"
+            )
+            console_dist_statistics(
+                dist=dist.distribution_partitions, metric="Size in MiB", console=console
+            )
+            console_dist_histogram(
+                dist=dist.distribution_partitions, metric="Size in MiB", console=console
+            )
+    finally:
+        console.flush()
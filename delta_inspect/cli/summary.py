@@ -1,13 +1,11 @@
 """CLI subcommand for Delta table summary functionality."""
 
 import typer
-from typing import Annotated
-from rich.console import Console
+from typing import TYPE_CHECKING, Annotated
 import json
 
-from delta_inspect.summary.core import summary
-from delta_inspect.summary.model import TableSummary
 from delta_inspect.util.cli import (
+    BufferedConsole,
     TableColumn,
     console_header,
     format_number,
@@ -15,13 +13,15 @@ from delta_inspect.util.cli import (
     console_table,
     WIDTH_COL_FIRST,
     WIDTH_REMAIN,
-    WIDTH_TOTAL,
 )
 
-console = Console()
+if TYPE_CHECKING:
+    from delta_inspect.summary.model import TableSummary
 
+__all__ = ["summary_command"]
 
-def create_overview_table(summary: TableSummary):
+
+def create_overview_table(console: BufferedConsole, summary: "TableSummary"):
     columns = [
         TableColumn(title="Property", style="cyan", width=WIDTH_COL_FIRST),
         TableColumn(title="Value", style="white", width=WIDTH_REMAIN),
@@ -51,7 +51,7 @@ def create_overview_table(summary: TableSummary):
     console_table(console=console, title="Overview", columns=columns, rows=rows)
 
 
-def create_table_stats_table(summary: TableSummary):
+def create_table_stats_table(console: BufferedConsole, summary: "TableSummary"):
     columns = [
         TableColumn(title="Metric", style="cyan", width=WIDTH_COL_FIRST),
         TableColumn(title="Value", style="white", width=WIDTH_REMAIN),
@@ -69,7 +69,7 @@ def create_table_stats_table(summary: TableSummary):
     console_table(console=console, title="Table Statistics", columns=columns, rows=rows)
 
 
-def create_column_stats_table(summary: TableSummary):
+def create_column_stats_table(console: BufferedConsole, summary: "TableSummary"):
     columns = [
         TableColumn(title="Column", style="cyan", width=WIDTH_COL_FIRST),
         TableColumn(title="Min", style="green"),
@@ -95,7 +95,7 @@ def create_column_stats_table(summary: TableSummary):
     )
 
 
-def create_schema_table(summary: TableSummary):
+def create_schema_table(console: BufferedConsole, summary: "TableSummary"):
     columns = [
         TableColumn(title="Column", style="cyan", width=WIDTH_COL_FIRST),
         TableColumn(title="Type", style="yellow", width=30),
@@ -125,10 +125,18 @@ def summary_command(
 ) -> None:
     """Summarize a Delta Lake table showing version, protocol, statistics, metadata and last commit timestamp."""
 
-    console_header(console=console, title="Delta Table Summary")
+    # deferred to keep `--help` and argument errors free of polars/deltalake
+    from delta_inspect.summary.core import summary
+
+    console = BufferedConsole()
+
+    try:
+        console_header(console=console, title="Delta Table Summary")
 
-    summary_report = summary(path)
-    create_overview_table(summary_report)
-    create_schema_table(summary_report)
-    create_table_stats_table(summary_report)
-    create_column_stats_table(summary_report)
+        summary_report = summary(path)
+        create_overview_table(console=console, summary=summary_report)
+        create_schema_table(console=console, summary=summary_report)
+        create_table_stats_table(console=console, summary=summary_report)
+        create_column_stats_table(console=console, summary=summary_report)
+    finally:
+        console.flush()
@@ -1,77 +1,112 @@
-from deltalake import DeltaTable
-import polars as pl
-import polars.selectors as cs
-
+from itertools import count
 from typing import Tuple
+
+import polars as pl
+from deltalake import DeltaTable
 from rtree import index
 
 from delta_inspect.clustering.model import Clustering
 from delta_inspect.util.history import extract_operation_params
+from delta_inspect.util.model import Histogram
 from delta_inspect.util.statistics import (
-    compute_distribution_metrics,
-    compute_histogram_metrics,
+    compute_discrete_distribution_metrics,
+    compute_discrete_histogram_metrics,
+    compute_value_counts,
 )
-from delta_inspect.util.table_loader import load_table
+from delta_inspect.util.table_loader import get_add_actions, get_history, load_table
 
 BINS = list(range(17)) + [32, 64, 128]
 
+# packed R-tree node tuning for bulk loading, see libspatialindex STR loading
+RTREE_LEAF_CAPACITY = 1000
+RTREE_FILL_FACTOR = 0.9
+
+# up to this memory of joined candidate pairs, overlaps are counted via a
+# vectorized self-join for any number of columns instead of querying an R-tree
+# row by row. Each pair carries the row index and all encoded bounds of both
+# sides, hence the join's memory grows with the number of columns.
+MAX_JOIN_BYTES = 128 * 1024**2
 
-def fill_min_max_values(dt: DeltaTable, columns: list[str]) -> pl.DataFrame:
+
+def fill_min_max_values(
+    dt: DeltaTable, columns: list[str], partition_columns: list[str]
+) -> pl.LazyFrame:
     """
     Fill missing minimum and maximum values in case of partitioned columns.
     Partitioned columns don't have min/max values in the DataFrame, so we
     extract them from the partition values.
-    """
 
-    df = pl.DataFrame(dt.get_add_actions())
-    partition_columns = dt.metadata().partition_columns
-
-    expr = []
-    for column in columns:
-        if column in partition_columns:
-            cpartition = pl.col("partition_values").struct.field(column)
-            expr.extend(
-                [cpartition.alias(f"{column}_min"), cpartition.alias(f"{column}_max")]
-            )
-        else:
-            expr.extend(
-                [
-                    pl.col("min").struct.field(column).alias(f"{column}_min"),
-                    pl.col("max").struct.field(column).alias(f"{column}_max"),
-                ]
-            )
-
-    return df.select("path", *expr)
-
-
-def get_dictionary_encoding(
-    df: pl.DataFrame, columns: list[str]
-) -> Tuple[pl.Series, pl.Series]:
+    The result is lazy to allow polars to fuse it with subsequent steps.
     """
-    Get a dictionary encoding for the specified columns in the DataFrame. This encoding
-    is used to convert categorical or string columns into numerical values for spatial indexing.
+    lf = pl.from_arrow(get_add_actions(dt), rechunk=False).lazy()
+    partition_set = set(partition_columns)
+
+    # fast path without any partition column: all bounds come from statistics
+    if partition_set.isdisjoint(columns):
+        expr = [
+            *[pl.col("min").struct.field(col).alias(f"{col}_min") for col in columns],
+            *[pl.col("max").struct.field(col).alias(f"{col}_max") for col in columns],
+        ]
+    else:
+        expr = []
+        for column in columns:
+            if column in partition_set:
+                cpartition = pl.col("partition_values").struct.field(column)
+                expr.extend(
+                    [
+                        cpartition.alias(f"{column}_min"),
+                        cpartition.alias(f"{column}_max"),
+                    ]
+                )
+            else:
+                expr.extend(
+                    [
+                        pl.col("min").struct.field(column).alias(f"{column}_min"),
+                        pl.col("max").struct.field(column).alias(f"{column}_max"),
+                    ]
+                )
+
+    return lf.select("path", *expr)
+
+
+def get_dictionary_encoding(col_min: str, col_max: str) -> Tuple[pl.Expr, pl.Expr]:
     """
+    Get a dictionary encoding for the specified min/max columns. This encoding is
+    used to convert categorical or string columns into numerical values for spatial
+    indexing.
 
-    values = [df.select(pl.col(column).unique()).to_series() for column in columns]
-
-    df_encoding = (
-        pl.concat(items=values).unique().sort().to_frame("key").with_row_index("value")
+    The codes are the dense rank of the stacked min and max values, hence they
+    preserve the ordering of the original values without collecting a dictionary
+    upfront.
+    """
+    codes = (
+        pl.concat([pl.col(col_min), pl.col(col_max)]).cast(pl.String).rank("dense") - 1
     )
-    return df_encoding["key"], df_encoding["value"]
+    return codes.head(pl.len()), codes.tail(pl.len())
 
 
-def apply_numerical_encoding(df: pl.DataFrame, columns: list[str]) -> pl.DataFrame:
+def apply_numerical_encoding(lf: pl.LazyFrame, columns: list[str]) -> pl.LazyFrame:
     """
-    Apply numerical encoding to specified columns in the DataFrame. This is required
+    Apply numerical encoding to specified columns in the LazyFrame. This is required
     for the spatial index to work correctly.
 
     Args:
-        df (pl.DataFrame): The input DataFrame.
+        lf (pl.LazyFrame): The input LazyFrame.
         columns (list[str]): List of column names to encode.
 
     Returns:
-        pl.DataFrame: DataFrame with encoded columns.
+        pl.LazyFrame: LazyFrame with encoded columns.
     """
+    narrow_integer_dtypes = (
+        pl.Int8,
+        pl.Int16,
+        pl.Int32,
+        pl.UInt8,
+        pl.UInt16,
+        pl.UInt32,
+    )
+
+    schema = lf.collect_schema()
 
     expr = []
     for column in columns:
@@ -84,27 +119,27 @@ def apply_numerical_encoding(df: pl.DataFrame, columns: list[str]) -> pl.DataFra
         pcol_min = pl.col(col_min)
         pcol_max = pl.col(col_max)
 
-        assert df[col_min].dtype == df[col_max].dtype
-        dtype = df[col_min].dtype
+        assert schema[col_min] == schema[col_max]
+        dtype = schema[col_min]
 
         if dtype in (pl.String, pl.Categorical):
-            key, value = get_dictionary_encoding(df, columns=[col_min, col_max])
+            # encoded within the same query, codes are 32 bit integers
+            encoded_min, encoded_max = get_dictionary_encoding(col_min, col_max)
             expr.extend(
                 [
-                    pcol_min.replace_strict(
-                        old=key, new=value, return_dtype=pl.Int64
-                    ).alias(col_encoded_min),
-                    pcol_max.replace_strict(
-                        old=key, new=value, return_dtype=pl.Int64
-                    ).alias(col_encoded_max),
+                    encoded_min.alias(col_encoded_min),
+                    encoded_max.alias(col_encoded_max),
                 ]
             )
 
-        elif dtype.is_temporal():
+        elif dtype.is_temporal() or dtype in narrow_integer_dtypes:
+            # keep integers at their native width, e.g. dates are 32 bit days,
+            # to compare narrow values when counting overlaps. Temporal values
+            # are reinterpreted as their physical integers without any copy.
             expr.extend(
                 [
-                    pcol_min.cast(pl.Int64).alias(col_encoded_min),
-                    pcol_max.cast(pl.Int64).alias(col_encoded_max),
+                    pcol_min.to_physical().alias(col_encoded_min),
+                    pcol_max.to_physical().alias(col_encoded_max),
                 ]
             )
         else:
@@ -115,26 +150,29 @@ def apply_numerical_encoding(df: pl.DataFrame, columns: list[str]) -> pl.DataFra
                 ]
             )
 
-    return df.select("path", *expr)
+    return lf.select("path", *expr)
 
 
-def remove_nulls(df: pl.DataFrame) -> pl.DataFrame:
+def remove_nulls(lf: pl.LazyFrame) -> pl.LazyFrame:
     """
-    Remove rows with null values from the DataFrame because R-tree index
+    Remove rows with null values from the LazyFrame because R-tree index
     does not support null values in the bounding box.
 
     Args:
-        df (pl.DataFrame): The input DataFrame.
+        lf (pl.LazyFrame): The input LazyFrame.
 
     Returns:
-        pl.DataFrame: DataFrame with null values removed.
+        pl.LazyFrame: LazyFrame with null values removed.
     """
-    return df.drop_nulls()
+    return lf.drop_nulls()
 
 
 def create_rtree_index(df_encoded: pl.DataFrame) -> index.Index:
     """
-    Create an R-tree index from the encoded DataFrame.
+    Create an R-tree index from the encoded DataFrame. The index is bulk loaded
+    from a stream which is considerably faster than inserting rows one by one
+    and yields a packed tree with wide, well filled leaves. The underlying spatial
+    index requires at least two dimensions, hence at least two columns.
 
     Args:
         df_encoded (pl.DataFrame): The encoded DataFrame.
@@ -142,14 +180,21 @@ def create_rtree_index(df_encoded: pl.DataFrame) -> index.Index:
     Returns:
         index.Index: An R-tree index.
     """
+    properties = index.Property()
+    properties.dimension = (df_encoded.width - 1) // 2
+    properties.leaf_capacity = RTREE_LEAF_CAPACITY
+    properties.fill_factor = RTREE_FILL_FACTOR
 
-    rindex = index.Index()
-    rindex.interleaved = False
+    # bulk loading requires at least one item
+    if df_encoded.is_empty():
+        return index.Index(properties=properties, interleaved=False)
 
-    for idx, row in enumerate(df_encoded.iter_rows()):
-        rindex.insert(idx, row[1:], row[0])
+    # convert column by column instead of materializing polars rows, ids are
+    # row positions generated by itertools.count without any python loop
+    paths, *bounds = (series.to_list() for series in df_encoded.get_columns())
+    stream = zip(count(), zip(*bounds), paths)
 
-    return rindex
+    return index.Index(stream, properties=properties, interleaved=False)
 
 
 def get_overlapping_partitions_count(
@@ -165,32 +210,122 @@ def get_overlapping_partitions_count(
     Returns:
         pl.DataFrame: DataFrame with overlapping partitions.
     """
+    # first column contains the path, remaining columns form the bounding box
+    bounds = (series.to_list() for series in df_non_nulls.get_columns()[1:])
+
+    # the only per-row work is the query itself, the self match is excluded
+    # afterwards in a vectorized manner
+    match_counts = pl.Series(map(rindex.count, zip(*bounds)), dtype=pl.Int64)
+
+    return df_non_nulls.with_columns(overlap_count=match_counts - 1)
+
+
+def get_overlapping_partitions_count_sweep(
+    df_non_nulls: pl.DataFrame, column: str
+) -> pl.DataFrame:
+    """
+    Get overlapping partitions count for a single column. In one dimension,
+    another file overlaps unless it starts after the current file ends or
+    ends before the current file starts. Both are counted via binary search
+    on the sorted minimum and maximum values.
 
-    bbox_column_indices = range(1, df_non_nulls.shape[1])
-    df_bbox = df_non_nulls.select(cs.by_index(bbox_column_indices))
-    overlap_counts = [rindex.count(row) - 1 for row in df_bbox.iter_rows()]
+    Args:
+        df_non_nulls (pl.DataFrame): The encoded DataFrame without null values.
+        column (str): The analyzed column name.
 
-    return df_non_nulls.with_columns(overlap_count=pl.Series(overlap_counts))
+    Returns:
+        pl.DataFrame: DataFrame with overlapping partitions.
+    """
+    pcol_min = pl.col(f"{column}_min_encoded")
+    pcol_max = pl.col(f"{column}_max_encoded")
+
+    # files starting not after the current end minus files ending before the
+    # current start, excluding the file itself
+    starts_before_end = pcol_min.sort().search_sorted(pcol_max, side="right")
+    ends_before_start = pcol_max.sort().search_sorted(pcol_min, side="left")
+    overlap_count = (
+        starts_before_end.cast(pl.Int64) - ends_before_start.cast(pl.Int64) - 1
+    )
 
+    return df_non_nulls.with_columns(overlap_count=overlap_count)
 
-def compute_overlap_metrics(df_overlap_count: pl.DataFrame) -> dict[str, int | float]:
+
+def get_overlapping_partitions_count_join(
+    df_non_nulls: pl.DataFrame, columns: list[str]
+) -> pl.DataFrame:
     """
-    Compute clustering metrics from the DataFrame with overlapping min/max ranges.
+    Get overlapping partitions count via a vectorized inequality self-join on
+    the encoded min/max bounding boxes. Each file overlaps with itself, hence
+    the self match is subtracted. All pairs overlapping in the first column are
+    joined before the remaining columns are filtered, hence the most selective
+    column should come first.
 
     Args:
-        df_overlap_count (pl.DataFrame): DataFrame with overlap counts.
+        df_non_nulls (pl.DataFrame): The encoded DataFrame without null values.
+        columns (list[str]): List of analyzed column names.
 
     Returns:
-        pl.DataFrame: DataFrame with clustering metrics.
+        pl.DataFrame: DataFrame with overlapping partitions.
     """
 
-    pcol = pl.col("overlap_count")
-    expr = [
-        pcol.eq(0).sum().alias("count_no_overlap"),
-        pcol.gt(0).sum().alias("count_with_overlap"),
-    ]
+    def overlap_predicates(column: str) -> list[pl.Expr]:
+        col_min = f"{column}_min_encoded"
+        col_max = f"{column}_max_encoded"
+        return [
+            pl.col(col_min) <= pl.col(f"{col_max}_right"),
+            pl.col(col_max) >= pl.col(f"{col_min}_right"),
+        ]
+
+    # join on the first column only, otherwise polars may pick two unselective
+    # predicates of different columns for the inequality join
+    column_first, *columns_rest = columns
+    df_indexed = df_non_nulls.drop("path").with_row_index("idx")
+    df_pairs = df_indexed.join_where(df_indexed, *overlap_predicates(column_first))
+    for column in columns_rest:
+        df_pairs = df_pairs.filter(*overlap_predicates(column))
+
+    df_counts = (
+        df_pairs.group_by("idx")
+        .agg((pl.len() - 1).cast(pl.Int64).alias("overlap_count"))
+        .sort("idx")
+    )
 
-    return df_overlap_count.select(*expr).row(0, named=True)
+    return df_non_nulls.with_columns(overlap_count=df_counts["overlap_count"])
+
+
+# constant expressions are built once at import
+_OVERLAP_METRICS_EXPR = [
+    pl.col("len")
+    .filter(pl.col("overlap_count").eq(0))
+    .sum()
+    .alias("count_no_overlap"),
+    pl.col("len")
+    .filter(pl.col("overlap_count").gt(0))
+    .sum()
+    .alias("count_with_overlap"),
+]
+
+
+def compute_overlap_metrics(
+    df_overlap_values: pl.DataFrame,
+) -> Tuple[dict[str, int | float], Histogram]:
+    """
+    Compute clustering metrics from the value counts of overlapping min/max
+    ranges. Overlap counts are integers with few distinct values, hence the
+    metrics and the histogram are derived from the value counts only.
+
+    Args:
+        df_overlap_values (pl.DataFrame): Value counts of overlap counts.
+
+    Returns:
+        Tuple[dict, Histogram]: Clustering metrics and histogram of overlap counts.
+    """
+    metrics = df_overlap_values.select(_OVERLAP_METRICS_EXPR).row(0, named=True)
+    hist = compute_discrete_histogram_metrics(
+        df_counts=df_overlap_values, column="overlap_count", bins=BINS
+    )
+
+    return metrics, hist
 
 
 def clustering_health(path: str, columns: list[str]) -> Clustering:
@@ -204,38 +339,67 @@ def clustering_health(path: str, columns: list[str]) -> Clustering:
     Returns:
         index.Index: An R-tree index.
     """
-
     dt = load_table(path)
+    partition_columns = dt.metadata().partition_columns
 
-    df_filled = fill_min_max_values(
+    lf_filled = fill_min_max_values(
         dt=dt,
         columns=columns,
+        partition_columns=partition_columns,
     )
-    df_encoded = apply_numerical_encoding(df_filled, columns)
-    null_counts = df_encoded.select(pl.any_horizontal(pl.all().is_null())).sum().item()
-    df_non_nulls = remove_nulls(df_encoded)
-
-    rindex = create_rtree_index(df_non_nulls)
-    df_overlap_count = get_overlapping_partitions_count(
-        rindex=rindex, df_non_nulls=df_non_nulls
+    lf_non_nulls = apply_numerical_encoding(remove_nulls(lf_filled), columns)
+
+    # materialize only once right before counting overlaps
+    df_non_nulls, df_null_counts = pl.collect_all(
+        [
+            lf_non_nulls,
+            lf_filled.select(pl.any_horizontal(pl.all().is_null()).sum()),
+        ]
     )
+    null_counts = df_null_counts.item()
+
+    if len(columns) == 1:
+        df_overlap_count = get_overlapping_partitions_count_sweep(
+            df_non_nulls=df_non_nulls, column=columns[0]
+        )
+    else:
+        # pairs overlapping within a single column are cheaply counted via the
+        # sweep and bound the size of the self-join led by that column
+        candidate_pairs = {
+            column: get_overlapping_partitions_count_sweep(
+                df_non_nulls=df_non_nulls, column=column
+            )["overlap_count"].sum()
+            + df_non_nulls.height
+            for column in columns
+        }
+        columns_join = sorted(columns, key=candidate_pairs.__getitem__)
+
+        join_bytes = candidate_pairs[columns_join[0]] * (2 + 4 * len(columns)) * 8
+        if join_bytes <= MAX_JOIN_BYTES:
+            df_overlap_count = get_overlapping_partitions_count_join(
+                df_non_nulls=df_non_nulls, columns=columns_join
+            )
+        else:
+            rindex = create_rtree_index(df_non_nulls)
+            df_overlap_count = get_overlapping_partitions_count(
+                rindex=rindex, df_non_nulls=df_non_nulls
+            )
 
-    metrics_overlap = compute_overlap_metrics(df_overlap_count)
-    metrics_distribution = compute_distribution_metrics(
+    df_overlap_values = compute_value_counts(
         df=df_overlap_count, column="overlap_count"
     )
-
-    hist = compute_histogram_metrics(
-        df=df_overlap_count, column="overlap_count", bins=BINS
+    metrics_overlap, hist = compute_overlap_metrics(df_overlap_values)
+    metrics_distribution = compute_discrete_distribution_metrics(
+        df=df_overlap_count, column="overlap_count", df_counts=df_overlap_values
     )
 
-    history = dt.history()
-    partition_columns = dt.metadata().partition_columns
-    clustering_columns = extract_operation_params(history=history, param_key="clusterBy")
+    history = get_history(dt)
+    clustering_columns = extract_operation_params(
+        history=history, param_key="clusterBy"
+    )
     zorder_columns = extract_operation_params(history=history, param_key="zOrderBy")
 
-    return Clustering(
-        dt=dt,
+    clustering = Clustering(
         analyzed_columns=columns,
         partition_columns=partition_columns,
         clustering_columns=clustering_columns,
@@ -245,3 +409,6 @@ def clustering_health(path: str, columns: list[str]) -> Clustering:
         **metrics_distribution,
         **metrics_overlap,
     )
+    clustering._dt = dt
+
+    return clustering
@@ -1,8 +1,12 @@
-from deltalake import DeltaTable
-from pydantic import Field
+from typing import TYPE_CHECKING
+
+from pydantic import Field, PrivateAttr
 
 from delta_inspect.util.model import BaseDistribution
 
+if TYPE_CHECKING:
+    from deltalake import DeltaTable
+
 
 class Clustering(BaseDistribution):
     """
@@ -17,7 +21,8 @@ class Clustering(BaseDistribution):
     are often overlapping which prevents efficient data pruning.
     """
 
-    dt: DeltaTable
+    # not validated nor serialized, set by `clustering_health`
+    _dt: "DeltaTable | None" = PrivateAttr(default=None)
 
     analyzed_columns: list[str]
     partition_columns: list[str] = Field(default_factory=list)
@@ -27,3 +32,8 @@ class Clustering(BaseDistribution):
     count_no_overlap: int
     count_with_overlap: int
     count_without_min_max: int
+
+    @property
+    def dt(self) -> "DeltaTable | None":
+        """The analyzed Delta table."""
+        return self._dt
@@ -1,16 +1,13 @@
 from typing import Literal
 import polars as pl
 
-from deltalake import DeltaTable
 from delta_inspect.distribution.model import (
     DistributionMetric,
     ItemDistribution,
     Distribution,
 )
-from delta_inspect.util.statistics import (
-    compute_distribution_metrics,
-    compute_histogram_metrics,
-)
+from delta_inspect.util.statistics import compute_all_metrics
+from delta_inspect.util.table_loader import get_add_actions, load_table
 
 BINS = (
     list(range(0, 16 + 1, 4))
@@ -21,31 +18,44 @@ BINS = (
 )
 
 
-def _get_min_max_items(
+def _min_max_items_expr(
     df: pl.DataFrame, column_key: str, column_by: str
-) -> dict[str, str]:
-    """Get the minimum and maximum items from a DataFrame."""
-    return df.select(
-        pl.col(column_key).top_k_by(by=column_by, k=1, reverse=False).alias("min_item"),
-        pl.col(column_key).top_k_by(by=column_by, k=1, reverse=True).alias("max_item"),
-    ).row(0, named=True)
+) -> list[pl.Expr]:
+    """Get the expressions for the minimum and maximum items of a DataFrame."""
+    pcol = pl.col(column_key)
+    expr = [
+        pcol.top_k_by(by=column_by, k=1, reverse=False).alias("min_item"),
+        pcol.top_k_by(by=column_by, k=1, reverse=True).alias("max_item"),
+    ]
+
+    # struct items are only serialized for the selected rows
+    if isinstance(df.schema[column_key], pl.Struct):
+        expr = [e.struct.json_encode() for e in expr]
+
+    return expr
 
 
 def _get_distribution(
     df: pl.DataFrame, column_key: str, metric: str
 ) -> ItemDistribution:
-    metrics_distribution = compute_distribution_metrics(df=df, column=metric)
-    metrics_hist = compute_histogram_metrics(df=df, column=metric, bins=BINS)
-    values_min_max = _get_min_max_items(df=df, column_key=column_key, column_by=metric)
+    # min/max items are aggregated within the same pass as the metrics
+    metrics, metrics_hist = compute_all_metrics(
+        df=df,
+        column=metric,
+        bins=BINS,
+        extra_expr=_min_max_items_expr(
+            df=df, column_key=column_key, column_by=metric
+        ),
+    )
 
-    return ItemDistribution(hist=metrics_hist, **values_min_max, **metrics_distribution)
+    return ItemDistribution(hist=metrics_hist, **metrics)
 
 
 def distribution(
     path: str, metric: DistributionMetric = DistributionMetric.FILE_SIZE
 ) -> Distribution:
-    dt = DeltaTable(path)
-    df_files = pl.DataFrame(dt.get_add_actions())
+    dt = load_table(path)
+    df_files = pl.from_arrow(get_add_actions(dt), rechunk=False)
 
 
     if metric == DistributionMetric.FILE_SIZE:
@@ -61,9 +71,7 @@ def distribution(
     )
 
     if dt.metadata().partition_columns:
-        df_partition = df_files.group_by(
-            pl.col("partition_values").struct.json_encode()
-        ).agg(
+        df_partition = df_files.group_by("partition_values").agg(
             pl.col("size_bytes").sum().alias("size_bytes"),
             pl.col("num_records").sum().alias("num_records"),
         )
@@ -73,9 +81,11 @@ def distribution(
     else:
         distribution_partitions = None
 
-    return Distribution(
-        dt=dt,
+    distribution = Distribution(
         metric=metric,
         distribution_files=distribution_files,
         distribution_partitions=distribution_partitions,
     )
+    distribution._dt = dt
+
+    return distribution
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class DistributionMetric(Enum):
+    FILE_SIZE = "file_size"
+    NUM_RECORDS = "num_records"
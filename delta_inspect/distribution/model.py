@@ -1,13 +1,12 @@
-from enum import Enum
-from deltalake import DeltaTable
-from pydantic import BaseModel
+from typing import TYPE_CHECKING
 
-from delta_inspect.util.model import BaseDistribution
+from pydantic import BaseModel, PrivateAttr
 
+from delta_inspect.distribution.metric import DistributionMetric
+from delta_inspect.util.model import BaseDistribution
 
-class DistributionMetric(Enum):
-    FILE_SIZE = "file_size"
-    NUM_RECORDS = "num_records"
+if TYPE_CHECKING:
+    from deltalake import DeltaTable
 
 
 class ItemDistribution(BaseDistribution):
@@ -21,8 +20,15 @@ class Distribution(BaseModel):
     is used, additionally stores file sizes aggregated over partition values.
     """
 
-    dt: DeltaTable
+    # not validated nor serialized, set by `distribution`
+    _dt: "DeltaTable | None" = PrivateAttr(default=None)
+
     metric: DistributionMetric
 
     distribution_files: ItemDistribution
     distribution_partitions: ItemDistribution | None = None
+
+    @property
+    def dt(self) -> "DeltaTable | None":
+        """The analyzed Delta table."""
+        return self._dt
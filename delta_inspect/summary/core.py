@@ -2,17 +2,39 @@
 
 import datetime
 import json
+from typing import Any
 from deltalake import DeltaTable
 import polars as pl
-from delta_inspect.util.history import extract_operation_params
+from pydantic import TypeAdapter
+from delta_inspect.util.history import PARAM_OPERATIONS, parse_operation_param
 from delta_inspect.util.misc import to_datetime
-from delta_inspect.util.table_loader import load_table
+from delta_inspect.util.table_loader import get_add_actions, get_history, load_table
 from delta_inspect.summary.model import ColumnStatistics, SchemaField, TableMetadata, TableStatistics, TableSummary
 
+# validator is built once and reused for all fields of all tables
+_SCHEMA_ADAPTER = TypeAdapter(list[SchemaField])
+
+# constant expressions are built once at import
+_TABLE_STATS_EXPR = [
+    pl.len().alias("num_files"),
+    pl.sum("size_bytes").alias("total_size_bytes"),
+    pl.sum("num_records").alias("num_records"),
+]
+
 
 def _extract_schema(dt: DeltaTable) -> list[SchemaField]:
     """Extract schema information from Delta table."""
-    return [SchemaField.model_validate(field) for field in dt.schema().fields]
+    # stringify types upfront so that only primitive values are validated
+    fields = [
+        {
+            "name": field.name,
+            "type": str(field.type),
+            "nullable": field.nullable,
+            "metadata": dict(field.metadata),
+        }
+        for field in dt.schema().fields
+    ]
+    return _SCHEMA_ADAPTER.validate_python(fields)
 
 
 def _extract_table_statistics(dt: DeltaTable, df_add_actions: pl.DataFrame) -> TableStatistics:
@@ -25,48 +47,55 @@ def _extract_table_statistics(dt: DeltaTable, df_add_actions: pl.DataFrame) -> T
             num_partitions=0
         )
 
-    expr = [
-            pl.len().alias("num_files"),
-            pl.sum("size_bytes").alias("total_size_bytes"),
-            pl.sum("num_records").alias("num_records")
-    ]
-
-    result = df_add_actions.select(expr).row(0, named=True)
+    result = df_add_actions.select(_TABLE_STATS_EXPR).row(0, named=True)
     result["num_partitions"] = len(dt.partitions())
 
     return TableStatistics(**result)
 
-def _extract_column_statistic(df_add_actions: pl.DataFrame, column: str) -> ColumnStatistics:
-    if "partition_values" in df_add_actions.columns:
-        partition_columns = df_add_actions["partition_values"].struct.fields
-    else:
-        partition_columns = []
-
+def _column_statistic_expr(column: str, partition_columns: list[str]) -> list[pl.Expr]:
     if column in partition_columns:
         pcol = pl.col("partition_values").struct.field(column)
         expr = [
-            pcol.min().alias("min"),
-            pcol.max().alias("max"),
-            pl.lit(0).alias("null_count")  # Partition columns should never be null
+            pcol.min(),
+            pcol.max(),
+            pl.lit(0)  # Partition columns should never be null
         ]
     else:
         expr = [
-            pl.col("min").struct.field(column).min().alias("min"),
-            pl.col("max").struct.field(column).max().alias("max"),
-            pl.col("null_count").struct.field(column).sum().alias("null_count")
+            pl.col("min").struct.field(column).min(),
+            pl.col("max").struct.field(column).max(),
+            pl.col("null_count").struct.field(column).sum()
         ]
 
-    result = df_add_actions.select(expr).row(0, named=True)
-    return ColumnStatistics(**result)
+    names = [f"{column}__min", f"{column}__max", f"{column}__null_count"]
+    return [e.alias(name) for e, name in zip(expr, names)]
 
 
 def _extract_column_statistics(df_add_actions: pl.DataFrame) -> dict[str, ColumnStatistics]:
     """Extract overall min/max values across all files from statistics."""
     if df_add_actions.is_empty():
         return {}
-    
+
+    if "partition_values" in df_add_actions.columns:
+        partition_columns = df_add_actions["partition_values"].struct.fields
+    else:
+        partition_columns = []
+
+    # aggregate all columns within a single pass over the add actions
     columns = df_add_actions["min"].struct.fields
-    return {column: _extract_column_statistic(df_add_actions, column) for column in columns}
+    expr = [
+        e for column in columns for e in _column_statistic_expr(column, partition_columns)
+    ]
+    result = df_add_actions.select(expr).row(0, named=True)
+
+    return {
+        column: ColumnStatistics(
+            min=result[f"{column}__min"],
+            max=result[f"{column}__max"],
+            null_count=result[f"{column}__null_count"],
+        )
+        for column in columns
+    }
 
 
 def _extract_last_commit_timestamp(history: list[dict]) -> datetime.datetime:
@@ -74,19 +103,42 @@ def _extract_last_commit_timestamp(history: list[dict]) -> datetime.datetime:
     return datetime.datetime.fromtimestamp(last_commit_timestamp_ms / 1000)
 
 
-def _extract_last_optimize_timestamp(history: list[dict]) -> datetime.datetime | None:
-    for commit in history:
-        if commit.get("operation") == "OPTIMIZE":
-            return to_datetime(commit["timestamp"])
+def _extract_history_summary(history: list[dict]) -> dict[str, Any]:
+    """
+    Extract the last optimize and vacuum timestamps as well as the clustering
+    and z-order columns within a single pass over the history. The history is
+    ordered from newest to oldest, hence the first match of each item wins.
+    """
+    result = {
+        "last_vacuum_timestamp": None,
+        "last_optimize_timestamp": None,
+        "clustering_columns": [],
+        "zorder_columns": [],
+    }
+    found_vacuum = found_optimize = found_params = False
 
-def _extract_last_vacuum_timestamp(history: list[dict]) -> datetime.datetime | None:
     for commit in history:
-        if commit.get("operation") != "VACUUM END":
-            continue
+        operation = commit.get("operation")
+
+        if not found_optimize and operation == "OPTIMIZE":
+            result["last_optimize_timestamp"] = to_datetime(commit["timestamp"])
+            found_optimize = True
+
+        if not found_vacuum and operation == "VACUUM END":
+            status = commit.get('operationParameters', {}).get('status')
+            if status == "COMPLETED":
+                result["last_vacuum_timestamp"] = to_datetime(commit["timestamp"])
+                found_vacuum = True
+
+        if not found_params and operation in PARAM_OPERATIONS:
+            result["clustering_columns"] = parse_operation_param(commit, "clusterBy")
+            result["zorder_columns"] = parse_operation_param(commit, "zOrderBy")
+            found_params = True
+
+        if found_vacuum and found_optimize and found_params:
+            break
 
-        status = commit.get('operationParameters', {}).get('status')
-        if status == "COMPLETED":
-            return to_datetime(commit["timestamp"])
+    return result
 
 
 def summary(path: str) -> TableSummary:
@@ -101,18 +153,15 @@ def summary(path: str) -> TableSummary:
     meta_data = TableMetadata.model_validate(dt.metadata())
     
     # Get active files using get_add_actions (returns Arrow RecordBatch)
-    add_actions_batch = dt.get_add_actions()
-    df_add_actions = pl.DataFrame(add_actions_batch)
+    add_actions_batch = get_add_actions(dt)
+    df_add_actions = pl.from_arrow(add_actions_batch, rechunk=False)
     
     table_statistics = _extract_table_statistics(dt, df_add_actions)
     column_statistics = _extract_column_statistics(df_add_actions)
 
-    history = dt.history()
+    history = get_history(dt)
     last_commit_timestamp = _extract_last_commit_timestamp(history)
-    last_vacuum_timestamp = _extract_last_vacuum_timestamp(history)
-    last_optimize_timestamp = _extract_last_optimize_timestamp(history)
-    clustering_columns = extract_operation_params(history=history, param_key="clusterBy")
-    zorder_columns = extract_operation_params(history=history, param_key="zOrderBy")
+    history_summary = _extract_history_summary(history)
     
     
     return TableSummary(
@@ -123,8 +172,5 @@ def summary(path: str) -> TableSummary:
         table_statistics=table_statistics,
         column_statistics=column_statistics,
         last_commit_timestamp=last_commit_timestamp,
-        last_vacuum_timestamp=last_vacuum_timestamp,
-        last_optimize_timestamp=last_optimize_timestamp,
-        clustering_columns=clustering_columns,
-        zorder_columns=zorder_columns
+        **history_summary,
     )
\ No newline at end of file
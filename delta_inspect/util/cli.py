@@ -1,56 +1,99 @@
-from rich.console import Console
-from rich.table import Table
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from rich.console import Console, Group, RenderableType
+from rich.table import Column, Table
 from rich.panel import Panel
 from rich.align import Align
-from pydantic import BaseModel
 
-from delta_inspect.util.model import BaseDistribution
+if TYPE_CHECKING:
+    from delta_inspect.util.model import BaseDistribution
 
 WIDTH_COL_FIRST = 30
 WIDTH_TOTAL = 90
 WIDTH_REMAIN = WIDTH_TOTAL - WIDTH_COL_FIRST
 
+BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# identical panel settings of every header
+HEADER_PANEL = {
+    "title": "📊 delta-inspect",
+    "width": WIDTH_TOTAL,
+    "style": "bold blue",
+    "padding": 1,
+}
+
+# number formatters dispatched by the exact type of the value
+NUMBER_FORMATS = {int: "{:,}".format, float: "{:.3f}".format}
+
+# bars of histogram rows are slices of the full width bar
+HIST_BAR_WIDTH = 20
+HIST_BAR = "█" * HIST_BAR_WIDTH
+
+
+class BufferedConsole:
+    """
+    Collect renderables of a report and print them at once. Rendering a single
+    group avoids a separate layout and render pass of the console per table.
+    """
+
+    def __init__(self, console: Console | None = None):
+        self._console = console or Console()
+        self._buf: list[RenderableType] = []
 
-class TableColumn(BaseModel):
+    def write(self, renderable: RenderableType = "") -> None:
+        self._buf.append(renderable)
+
+    def flush(self) -> None:
+        if self._buf:
+            self._console.print(Group(*self._buf))
+            self._buf.clear()
+
+
+@dataclass(slots=True, frozen=True)
+class TableColumn:
     title: str
     style: str | None = None
     width: int = 20
 
 
-def console_header(console: Console, title: str):
-    title = Panel(
-        renderable=Align(title, align="center"),
-        title=f"📊 delta-inspect",
-        width=90,
-        style="bold blue",
-        padding=1
-    )
+def console_header(console: BufferedConsole, title: str):
+    header = Panel(Align(title, align="center"), **HEADER_PANEL)
 
-    console.print(title)
-    console.print()
+    console.write(header)
+    console.write()
 
 
 def console_table(
-    console: Console, title: str, columns: list[TableColumn], rows: list[list]
+    console: BufferedConsole,
+    title: str,
+    columns: list[TableColumn],
+    rows: Iterable[list],
 ):
-    metadata_table = Table(title=title, show_header=True, header_style="bold magenta")
-    for column in columns:
-        metadata_table.add_column(column.title, style=column.style, width=column.width)
+    table_columns = (
+        Column(header=column.title, style=column.style or "", width=column.width)
+        for column in columns
+    )
+    metadata_table = Table(
+        *table_columns, title=title, show_header=True, header_style="bold magenta"
+    )
     for row in rows:
-        metadata_table.add_row(*[str(item) for item in row])
+        metadata_table.add_row(*map(str, row))
 
-    console.print(metadata_table)
-    console.print()
+    console.write(metadata_table)
+    console.write()
 
 
 def format_number(val: int | float | str) -> str:
     """Format numbers with appropriate precision."""
-    if isinstance(val, int):
-        return f"{val:,}"
-    elif isinstance(val, float):
-        return f"{val:.3f}"
-    else:
-        return val
+    fmt = NUMBER_FORMATS.get(type(val))
+    if fmt is None:
+        # subclasses such as bool are resolved via their base type
+        fmt = next((f for t, f in NUMBER_FORMATS.items() if isinstance(val, t)), None)
+        if fmt is None:
+            return val
+
+    return fmt(val)
 
 
 def format_bytes(bytes_value: int) -> str:
@@ -58,18 +101,37 @@ def format_bytes(bytes_value: int) -> str:
     if bytes_value == 0:
         return "0 B"
 
-    units = ["B", "KB", "MB", "GB", "TB"]
-    size = float(bytes_value)
-    unit_index = 0
+    # each unit spans 10 bits, hence the bit length determines the unit
+    unit_index = min((bytes_value.bit_length() - 1) // 10, len(BYTE_UNITS) - 1)
+    size = bytes_value / (1 << (10 * unit_index))
 
-    while size >= 1024 and unit_index < len(units) - 1:
-        size /= 1024
-        unit_index += 1
+    return f"{size:.1f} {BYTE_UNITS[unit_index]}"
 
-    return f"{size:.1f} {units[unit_index]}"
 
+def _dist_histogram_rows(dist: "BaseDistribution") -> Iterator[list[str]]:
+    """Yield the rows of the histogram table one at a time."""
 
-def console_dist_histogram(dist: BaseDistribution, metric: str, console: Console):
+    bins = dist.hist.bins
+    cnts = dist.hist.cnts
+
+    count_total = sum(cnts)
+    count_max = max(cnts)
+
+    range_strs = [f"[{lower}-{upper})" for lower, upper in zip([0, *bins[:-1]], bins)]
+    if len(bins) > 1:
+        range_strs[-1] = f"[{bins[-2]}-∞"
+
+    for range_str, count in zip(range_strs, cnts):
+        percentage = (count / count_total * 100) if count_total > 0 else 0
+        bar_length = int((count / count_max) * HIST_BAR_WIDTH) if count_max > 0 else 0
+        bar = HIST_BAR[:bar_length]
+
+        yield [range_str, format_number(count), f"{percentage:.1f}%", bar]
+
+
+def console_dist_histogram(
+    dist: "BaseDistribution", metric: str, console: BufferedConsole
+):
     """Create a Rich table for the histogram of overlap counts."""
 
     columns = [
@@ -79,33 +141,17 @@ def console_dist_histogram(dist: BaseDistribution, metric: str, console: Console
         TableColumn(title="Bar", style="green"),
     ]
 
-    count_total = sum(dist.hist.cnts)
-    count_max = max(dist.hist.cnts)
-    bin_count = len(dist.hist.bins)
-
-    rows = []
-    for idx, (bin_current, count) in enumerate(zip(dist.hist.bins, dist.hist.cnts)):
-        if idx == 0:
-            range_str = f"[0-{bin_current})"
-        elif idx < bin_count - 1:
-            bin_previous = dist.hist.bins[idx - 1]
-            range_str = f"[{bin_previous}-{bin_current})"
-        else:
-            bin_previous = dist.hist.bins[idx - 1]
-            range_str = f"[{bin_previous}-∞"
-
-        percentage = (count / count_total * 100) if count_total > 0 else 0
-        bar_length = int((count / count_max) * 20) if count_max > 0 else 0
-        bar = "█" * bar_length
-
-        rows.append([range_str, format_number(count), f"{percentage:.1f}%", bar])
-
     console_table(
-        console=console, title="Distribution - Histogram", columns=columns, rows=rows
+        console=console,
+        title="Distribution - Histogram",
+        columns=columns,
+        rows=_dist_histogram_rows(dist),
     )
 
 
-def console_dist_statistics(dist: BaseDistribution, metric: str, console: Console):
+def console_dist_statistics(
+    dist: "BaseDistribution", metric: str, console: BufferedConsole
+):
     columns = [
         TableColumn(title="Metric", style="cyan", width=WIDTH_COL_FIRST),
         TableColumn(title=metric, style="white", width=30),
@@ -1,21 +1,38 @@
 import json
-from typing import Any
+
+# operations which carry the clustering and z-order columns
+PARAM_OPERATIONS = frozenset({"OPTIMIZE", "CREATE TABLE"})
+
+
+def parse_operation_param(commit: dict, param_key: str) -> list[str]:
+    """
+    Parse a JSON encoded list of columns from the operationParameters of a
+    single commit. Missing parameters result in an empty list.
+    """
+
+    params = commit.get("operationParameters")
+    if not params:
+        return []
+
+    param = params.get(param_key)
+    if param:
+        return json.loads(param) or []
+
+    return []
 
 
 def extract_operation_params(
     history: list[dict],
     param_key: str,
-    operations: set[str] = {"OPTIMIZE", "CREATE TABLE"},
-) -> Any:
+    operations: frozenset[str] = PARAM_OPERATIONS,
+) -> list[str]:
     """
-    Get operationParameters from history.
+    Get operationParameters from history. Without any matching commit, an
+    empty list is returned.
     """
 
     for commit in history:
         if commit.get("operation") in operations:
-            param = commit.get("operationParameters", {}).get(param_key)
-            if param: 
-                return json.loads(param)
-            else:
-                return
+            return parse_operation_param(commit, param_key)
 
+    return []
@@ -1,16 +1,21 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 NUMERIC = int | float
 
 
 class Histogram(BaseModel):
     """Class for holding histogram information"""
-    
+
+    model_config = ConfigDict(frozen=True)
+
     bins: list[NUMERIC]
     cnts: list[int]
 
 class BaseDistribution(BaseModel):
     """Base class for holding distribution information"""
+
+    model_config = ConfigDict(frozen=True)
+
     count: int
     mean: NUMERIC
     std: NUMERIC | None
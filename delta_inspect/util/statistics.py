@@ -1,47 +1,198 @@
+import math
+from typing import Sequence, Tuple
+
 import polars as pl
 
 from delta_inspect.util.model import Histogram
 
+QUANTILES = {"q05": 0.05, "q25": 0.25, "q50": 0.5, "q75": 0.75, "q95": 0.95}
+
+
+def distribution_expr(column: str) -> list[pl.Expr]:
+    """
+    Get the distribution metrics as aggregation expressions which can be fused
+    with other aggregations into a single `select`.
+    """
+
+    pcol = pl.col(column)
+    return [
+        pl.len().alias("count"),
+        pcol.min().alias("min"),
+        *(pcol.quantile(quantile).alias(name) for name, quantile in QUANTILES.items()),
+        pcol.max().alias("max"),
+        pcol.mean().alias("mean"),
+        pcol.std().alias("std"),
+    ]
+
 
 def compute_distribution_metrics(
     df: pl.DataFrame, column: str
 ) -> dict[str, int | float]:
     """
     Compute distribution metrics from the DataFrame.
+
+    Quantiles are intentionally not derived from a presorted column. Polars
+    selects each quantile without sorting, which is considerably faster than
+    a single full sort of the column.
+    """
+
+    return df.select(*distribution_expr(column)).row(0, named=True)
+
+
+def compute_all_metrics(
+    df: pl.DataFrame,
+    column: str,
+    bins: list[float | int],
+    extra_expr: Sequence[pl.Expr] = (),
+) -> Tuple[dict[str, int | float], Histogram]:
     """
+    Compute distribution and histogram metrics from the DataFrame within a
+    single pass over the column. Additional aggregations via `extra_expr` are
+    fused into the same `select` and returned along with the metrics.
+    """
+
+    expr = [
+        *distribution_expr(column),
+        *histogram_metrics_expr(column, bins),
+        *extra_expr,
+    ]
+    metrics = df.select(*expr).row(0, named=True)
+    hist = histogram_from_metrics(metrics)
+
+    return metrics, hist
+
+
+def compute_value_counts(df: pl.DataFrame, column: str) -> pl.DataFrame:
+    """
+    Count the occurrences of each distinct non null value of a column, sorted
+    by value. The counts are stored in the `len` column.
+    """
+
+    return df.group_by(column).len().drop_nulls().sort(column)
+
+
+def compute_discrete_distribution_metrics(
+    df: pl.DataFrame, column: str, df_counts: pl.DataFrame | None = None
+) -> dict[str, int | float]:
+    """
+    Compute distribution metrics for a column with few distinct integer values,
+    e.g. overlap counts. All quantiles are derived from the cumulative value
+    counts at once instead of selecting each quantile separately. Results are
+    identical to `compute_distribution_metrics`. Already computed
+    `compute_value_counts` may be passed to avoid grouping the column again.
+    """
+
+    if df.is_empty():
+        return compute_distribution_metrics(df=df, column=column)
 
     pcol = pl.col(column)
     expr = [
         pl.len().alias("count"),
         pcol.min().alias("min"),
-        pcol.quantile(0.05).alias("q05"),
-        pcol.quantile(0.25).alias("q25"),
-        pcol.quantile(0.5).alias("q50"),
-        pcol.quantile(0.75).alias("q75"),
-        pcol.quantile(0.95).alias("q95"),
         pcol.max().alias("max"),
         pcol.mean().alias("mean"),
         pcol.std().alias("std"),
     ]
-    return df.select(*expr).row(0, named=True)
+    metrics = df.select(*expr).row(0, named=True)
 
+    if df_counts is None:
+        df_counts = compute_value_counts(df=df, column=column)
 
-def compute_histogram_metrics(
-    df: pl.DataFrame, column: str, bins: list[float | int]
-) -> Histogram:
-    
-    df_hist = df[column].hist(bins=bins)
+    values = df_counts[column]
+    cum_counts = df_counts["len"].cum_sum()
+    num_values = cum_counts[-1]
+
+    # rank selection equivalent to polars' default "nearest" interpolation
+    for name, quantile in QUANTILES.items():
+        rank = math.floor((num_values - 1) * quantile + 0.5)
+        position = cum_counts.search_sorted(rank, side="right")
+        metrics[name] = float(values[position])
+
+    return metrics
+
+
+def histogram_expr(column: str, bins: list[float | int]) -> pl.Expr:
+    """
+    Get the polars histogram as an aggregation expression which can be fused
+    with other aggregations into a single `select`.
+    """
+
+    return pl.col(column).hist(bins=bins, include_breakpoint=True).implode()
+
+
+def histogram_metrics_expr(column: str, bins: list[float | int]) -> list[pl.Expr]:
+    """
+    Get all aggregation expressions required by `histogram_from_metrics`. Their
+    aliases are prefixed with `hist` to not collide with other metrics.
+    """
+
+    pcol = pl.col(column)
+    return [
+        histogram_expr(column=column, bins=bins).alias("hist"),
+        pcol.max().alias("hist_max"),
+        pcol.gt(bins[-1]).sum().alias("hist_greater_than_max_bin"),
+        pcol.lt(bins[0]).sum().alias("hist_lower_than_min_bin"),
+    ]
+
+
+def histogram_from_metrics(metrics: dict[str, object]) -> Histogram:
+    """
+    Create the histogram from the aggregated `histogram_metrics_expr`. The
+    histogram related entries are removed from the given metrics.
+    """
+
+    df_hist = pl.DataFrame(metrics.pop("hist"))
     hist_bins = df_hist["breakpoint"].to_list()
     hist_cnts = df_hist["count"].to_list()
 
     # polars histogram does not include values greater than highest bin
-    # hence we have do add it manually
-    max_value = df[column].max()
-    greater_than_max_bin = df.filter(pl.col(column) >= hist_bins[-1]).shape[0]
-    hist_bins.append(max_value)
-    hist_cnts.append(greater_than_max_bin)
+    # hence we have do add it manually, the highest bin itself is included
+    hist_bins.append(metrics.pop("hist_max"))
+    hist_cnts.append(metrics.pop("hist_greater_than_max_bin"))
+
+    hist_cnts[0] += metrics.pop("hist_lower_than_min_bin")
+
+    return Histogram.model_construct(bins=hist_bins, cnts=hist_cnts)
+
+
+def compute_histogram_metrics(
+    df: pl.DataFrame, column: str, bins: list[float | int]
+) -> Histogram:
+    """
+    Compute histogram metrics from the DataFrame.
+    """
+
+    metrics = df.select(*histogram_metrics_expr(column, bins)).row(0, named=True)
+    return histogram_from_metrics(metrics)
+
+
+def compute_discrete_histogram_metrics(
+    df_counts: pl.DataFrame, column: str, bins: list[float | int]
+) -> Histogram:
+    """
+    Compute histogram metrics from the `compute_value_counts` of a column with
+    few distinct integer values, e.g. overlap counts. Only the distinct values
+    are assigned to bins instead of binning every row. Results are identical to
+    `compute_histogram_metrics`.
+    """
+
+    values = df_counts[column]
+
+    # same bin edges as polars histogram: the first bin is closed on both sides
+    # and also receives values lower than the lowest bin, values greater than
+    # the highest bin are collected in an additional last bin
+    bin_idx = pl.Series(bins).search_sorted(values, side="left").clip(1) - 1
+    df_bins = (
+        pl.DataFrame({"bin": bin_idx, "count": df_counts["len"]})
+        .group_by("bin")
+        .agg(pl.col("count").sum())
+    )
+
+    hist_cnts = [0] * len(bins)
+    for idx, count in df_bins.iter_rows():
+        hist_cnts[idx] = count
 
-    lower_than_min_bin = df.filter(pl.col(column) < bins[0]).shape[0]
-    hist_cnts[0] += lower_than_min_bin
+    hist_bins = [float(value) for value in bins[1:]]
+    hist_bins.append(values[-1] if len(values) else None)
 
-    return Histogram(bins=hist_bins, cnts=hist_cnts)
+    return Histogram.model_construct(bins=hist_bins, cnts=hist_cnts)
@@ -1,4 +1,56 @@
+from dataclasses import dataclass, field
+from functools import lru_cache
+
 from deltalake import DeltaTable
 
+
+@dataclass(frozen=True)
+class _TableVersion:
+    """
+    Cache key of a table at a specific version. The table id distinguishes
+    tables recreated at the same uri, which restart at version 0. The table
+    itself is not part of the key and only used to read the Delta log on cache
+    misses.
+    """
+
+    table_uri: str
+    table_id: str
+    version: int
+    dt: DeltaTable = field(compare=False, repr=False)
+
+
+def _table_version(dt: DeltaTable) -> _TableVersion:
+    return _TableVersion(
+        table_uri=dt.table_uri,
+        table_id=dt.metadata().id,
+        version=dt.version(),
+        dt=dt,
+    )
+
+
 def load_table(path: str) -> DeltaTable:
+    """
+    Load the latest version of a Delta table. Tables are intentionally not
+    cached by path to always reflect the latest commit.
+    """
     return DeltaTable(path)
+
+
+@lru_cache(maxsize=16)
+def _read_add_actions(table: _TableVersion):
+    return table.dt.get_add_actions()
+
+
+@lru_cache(maxsize=16)
+def _read_history(table: _TableVersion) -> list[dict]:
+    return table.dt.history()
+
+
+def get_add_actions(dt: DeltaTable):
+    """Get the add actions of the table, cached per table and version."""
+    return _read_add_actions(_table_version(dt))
+
+
+def get_history(dt: DeltaTable) -> list[dict]:
+    """Get the commit history of the table, cached per table and version."""
+    return _read_history(_table_version(dt))
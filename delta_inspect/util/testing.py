@@ -1,14 +1,17 @@
 import datetime
 from enum import IntEnum, Enum
+from functools import cache, cached_property
 from pathlib import Path
-from typing import Annotated, Literal, Tuple
+from typing import TYPE_CHECKING, Literal, Tuple
 
 import polars as pl
-from pyspark.sql import SparkSession
-from delta import configure_spark_with_delta_pip, DeltaTable as DeltaTableSpark
+import pyarrow as pa
 from deltalake import DeltaTable as DeltaTableRust, write_deltalake
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from delta import DeltaTable as DeltaTableSpark
+
 
 class ColumnType(IntEnum):
     """
@@ -44,7 +47,12 @@ DEFAULT_NULL_COUNTS = {
 }
 
 
+@cache
 def get_spark_context():
+    # spark is only required for the spark engine
+    from delta import configure_spark_with_delta_pip
+    from pyspark.sql import SparkSession
+
     builder = (
         SparkSession.builder.appName("Testing")
         .config("spark.sql.extensions", "io.delta.sql.DeltaSparkSessionExtension")
@@ -78,7 +86,10 @@ class TestDeltaTable(BaseModel):
 
     """
 
-    path: Path | str = Annotated[datetime.datetime, BeforeValidator(_unix_ms_to_datetime)]
+    # not a test class, despite its name
+    __test__ = False
+
+    path: Path | str
     name: str | None = "DeltaLakeTestTable"
     description: str | None = "An artifical Delta Lake Test Table used for testing."
     configuration: dict[str, str] = Field(default={"logRetentionDuration": "1"})
@@ -100,25 +111,25 @@ class TestDeltaTable(BaseModel):
     partition_by: list[str] | None = None
     cluster_by: list[str] | None = None
 
-    @property
+    @cached_property
     def _row_start(self) -> int:
         if isinstance(self.row_index, int):
             return 0
         else:
-            return self._row_start
+            return self.row_index[0]
 
-    @property
+    @cached_property
     def _row_end(self) -> int:
         if isinstance(self.row_index, int):
             return self.row_index
         else:
-            return self._row_end
+            return self.row_index[1]
 
     def _generate_integer_column(self, name: str) -> pl.Series:
         """
         Generate a column of integers for the Delta Table.
         """
-        return pl.Series(name, range(self._row_start, self._row_end))
+        return pl.int_range(self._row_start, self._row_end, eager=True).alias(name)
 
     def _generate_float_column(self, name: str) -> pl.Series:
         """
@@ -152,9 +163,8 @@ class TestDeltaTable(BaseModel):
         """
         Generate a column of strings for the Delta Table.
         """
-        return pl.Series(
-            name, [f"string_{i}" for i in range(self._row_start, self._row_end)]
-        )
+        values = pl.int_range(self._row_start, self._row_end, eager=True)
+        return ("string_" + values.cast(pl.String)).alias(name)
 
     def generate(self) -> pl.DataFrame:
         """
@@ -179,20 +189,23 @@ class TestDeltaTable(BaseModel):
                 raise ValueError("Invalid dtype encountered.")
 
         if isinstance(self.null_count, dict):
-            for col_name, count in self.null_count.items():
-                indices = list(range(0, count))
-                data[col_name][indices] = None
+            null_counts = self.null_count
+        else:
+            null_counts = dict.fromkeys(self.schema_, self.null_count)
 
-        elif isinstance(self.null_count, int):
-            indices = list(range(0, self.null_count))
-            for col_name in self.schema_.keys():
-                data[col_name][indices] = None
+        # indices are shared by all columns with the same null count
+        indices: dict[int, pl.Series] = {}
+        for col_name, count in null_counts.items():
+            if count not in indices:
+                indices[count] = pl.int_range(0, count, eager=True)
+            data[col_name] = data[col_name].scatter(indices[count], None)
 
         df = pl.DataFrame(data)
 
         if self.replication:
             duplication_factor = self.replication + 1
-            df = pl.concat([df] * duplication_factor)
+            num_rows = df.height * duplication_factor
+            df = df.select(pl.all().gather(pl.int_range(0, num_rows) % df.height))
 
         return df
 
@@ -212,13 +225,29 @@ class TestDeltaTable(BaseModel):
 
         return DeltaTableRust(self.path)
 
-    def _write_spark(self, df: pl.DataFrame) -> DeltaTableSpark:
+    def _write_spark(self, df: pl.DataFrame) -> "DeltaTableSpark":
+        from delta import DeltaTable as DeltaTableSpark
+        from pyspark.sql.pandas.types import from_arrow_schema
+
         spark = get_spark_context()
-        dfs = spark.createDataFrame(df.to_dicts())
+
+        # only the schema is required, hence it is converted from arrow directly
+        # instead of creating a spark DataFrame from all rows. Floats are widened
+        # to match spark's DoubleType inference for python floats and polars'
+        # large strings are narrowed to the string type known to spark.
+        df_schema = df.head(0).cast({pl.Float32: pl.Float64})
+        arrow_schema = df_schema.to_arrow(compat_level=pl.CompatLevel.oldest()).schema
+        arrow_schema = pa.schema(
+            field.with_type(pa.string())
+            if pa.types.is_large_string(field.type)
+            else field
+            for field in arrow_schema
+        )
+        schema = from_arrow_schema(arrow_schema)
 
         builder = (
             DeltaTableSpark.create(spark)
-            .addColumns(dfs.schema.fields)
+            .addColumns(schema.fields)
         )
 
         if self.name:
@@ -242,7 +271,7 @@ class TestDeltaTable(BaseModel):
     
     def write(
         self, engine: DeltaEngine = DeltaEngine.RUST
-    ) -> DeltaTableRust | DeltaTableSpark:
+    ) -> "DeltaTableRust | DeltaTableSpark":
         df = self.generate()
 
         if engine == DeltaEngine.RUST:
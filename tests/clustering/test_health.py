@@ -0,0 +1,76 @@
+import datetime
+
+import pytest
+import polars as pl
+from deltalake import write_deltalake
+from delta_inspect.clustering import core
+from delta_inspect.clustering.core import clustering_health
+
+
+# each write adds one file to the given partition, the last file has no
+# min/max values for `name` because all of its values are null
+FILES = [
+    ("a", ["a", "c"], [1, 2]),
+    ("a", ["b", "d"], [3, 4]),
+    ("b", ["x", "z"], [1, 4]),
+    ("b", [None, None], [4, 5]),
+]
+
+SCHEMA = {"part": pl.String, "name": pl.String, "day": pl.Date}
+
+
+@pytest.fixture(scope="session")
+def partitioned_table(tmp_path_factory):
+    """Create a partitioned Delta table with string, date and partition columns."""
+    tmp_path = tmp_path_factory.mktemp("clustering_table")
+    for part, names, days in FILES:
+        df = pl.DataFrame(
+            {
+                "part": [part] * len(names),
+                "name": names,
+                "day": [datetime.date(2024, 1, day) for day in days],
+            },
+            schema=SCHEMA,
+        )
+        write_deltalake(str(tmp_path), df, partition_by=["part"], mode="append")
+
+    return str(tmp_path)
+
+
+class TestClusteringHealth:
+    """Test overlap counts of a table end to end."""
+
+    @pytest.mark.parametrize(
+        "columns, count_with_overlap, max_overlap, count_without_min_max",
+        [
+            (["name"], 2, 1, 1),
+            (["day"], 4, 3, 0),
+            (["part", "name"], 2, 1, 1),
+            (["part", "day"], 2, 1, 0),
+            (["name", "day"], 0, 0, 1),
+            (["part", "name", "day"], 0, 0, 1),
+        ],
+    )
+    @pytest.mark.parametrize("max_join_bytes", [core.MAX_JOIN_BYTES, 0])
+    def test_overlap_counts(
+        self,
+        monkeypatch,
+        partitioned_table,
+        columns,
+        count_with_overlap,
+        max_overlap,
+        count_without_min_max,
+        max_join_bytes,
+    ):
+        """Test overlaps via the self-join and the R-tree including touching ranges."""
+        monkeypatch.setattr(core, "MAX_JOIN_BYTES", max_join_bytes)
+
+        health = clustering_health(partitioned_table, columns)
+
+        assert health.count == len(FILES) - count_without_min_max
+        assert health.count_with_overlap == count_with_overlap
+        assert health.count_no_overlap == health.count - count_with_overlap
+        assert health.count_without_min_max == count_without_min_max
+        assert health.max == max_overlap
+        assert health.partition_columns == ["part"]
+        assert health.clustering_columns == []
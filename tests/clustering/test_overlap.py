@@ -0,0 +1,62 @@
+import pytest
+import polars as pl
+from delta_inspect.clustering.core import (
+    create_rtree_index,
+    get_overlapping_partitions_count,
+    get_overlapping_partitions_count_join,
+    get_overlapping_partitions_count_sweep,
+)
+
+
+@pytest.fixture
+def encoded_intervals():
+    """Create encoded min/max bounds for two columns including touching ranges."""
+    return pl.DataFrame({
+        "path": ["a", "b", "c", "d", "e"],
+        "x_min_encoded": [0.0, 5.0, 10.0, 10.0, 30.0],
+        "x_max_encoded": [5.0, 9.0, 20.0, 12.0, 40.0],
+        "y_min_encoded": [0.0, 0.0, 3.0, 8.0, 0.0],
+        "y_max_encoded": [1.0, 2.0, 4.0, 9.0, 1.0],
+    })
+
+
+class TestOverlapCount:
+    """Test the different strategies to count overlapping files."""
+
+    def test_sweep_counts_single_column(self, encoded_intervals):
+        """Test that touching and nested ranges count as overlapping."""
+        df = encoded_intervals.select("path", "x_min_encoded", "x_max_encoded")
+        result = get_overlapping_partitions_count_sweep(df_non_nulls=df, column="x")
+        assert result["overlap_count"].to_list() == [1, 1, 1, 1, 0]
+
+    def test_sweep_counts_identical_ranges(self):
+        """Test that identical ranges overlap with all other files and empty input works."""
+        df = pl.DataFrame({
+            "path": ["a", "b", "c"],
+            "x_min_encoded": [1.0, 1.0, 1.0],
+            "x_max_encoded": [1.0, 1.0, 1.0],
+        })
+        result = get_overlapping_partitions_count_sweep(df_non_nulls=df, column="x")
+        assert result["overlap_count"].to_list() == [2, 2, 2]
+
+        result = get_overlapping_partitions_count_sweep(df_non_nulls=df.head(0), column="x")
+        assert result["overlap_count"].to_list() == []
+
+    def test_join_matches_sweep(self, encoded_intervals):
+        """Test that the self-join yields the same counts as the sweep."""
+        df = encoded_intervals.select("path", "x_min_encoded", "x_max_encoded")
+        sweep = get_overlapping_partitions_count_sweep(df_non_nulls=df, column="x")
+        join = get_overlapping_partitions_count_join(df_non_nulls=df, columns=["x"])
+        assert join.equals(sweep)
+
+    def test_join_matches_rtree(self, encoded_intervals):
+        """Test that the self-join yields the same counts as the R-tree."""
+        rindex = create_rtree_index(encoded_intervals)
+        rtree = get_overlapping_partitions_count(
+            rindex=rindex, df_non_nulls=encoded_intervals
+        )
+        join = get_overlapping_partitions_count_join(
+            df_non_nulls=encoded_intervals, columns=["x", "y"]
+        )
+        assert join.equals(rtree)
+        assert join["overlap_count"].to_list() == [1, 1, 0, 0, 0]
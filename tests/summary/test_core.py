@@ -0,0 +1,65 @@
+import datetime
+
+import pytest
+import polars as pl
+from deltalake import write_deltalake
+from delta_inspect.summary.core import summary
+
+
+DF_PARTITIONED = pl.DataFrame({
+    "id": [1, 2, 3, 4],
+    "part": ["a", "a", "b", "b"],
+    "value": [1.5, None, 3.0, 4.0]
+})
+
+
+@pytest.fixture(scope="session")
+def created_after():
+    """Capture the time right before the table is written, in commit precision."""
+    now = datetime.datetime.now()
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+
+@pytest.fixture(scope="session")
+def partitioned_table(tmp_path_factory, created_after):
+    """Create a partitioned Delta table for testing."""
+    tmp_path = tmp_path_factory.mktemp("partitioned_table")
+    write_deltalake(str(tmp_path), DF_PARTITIONED, partition_by=["part"])
+    return str(tmp_path)
+
+
+@pytest.fixture(scope="session")
+def table_summary(partitioned_table):
+    """Summarize the partitioned table once for all read-only assertions."""
+    return summary(partitioned_table)
+
+
+class TestSummary:
+    """Test the summary of a Delta table."""
+
+    def test_table_statistics(self, table_summary):
+        """Test that files, records and partitions are counted."""
+        stats = table_summary.table_statistics
+
+        assert table_summary.version == 0
+        assert stats.num_files == 2
+        assert stats.num_records == 4
+        assert stats.num_partitions == 2
+
+    def test_column_statistics(self, table_summary):
+        """Test that min, max and null counts are aggregated over files."""
+        stats = table_summary.column_statistics
+
+        assert (stats["id"].min, stats["id"].max, stats["id"].null_count) == (1, 4, 0)
+        assert stats["value"].null_count == 1
+
+    def test_schema_and_metadata(self, table_summary):
+        """Test that schema fields and partition columns are extracted."""
+        assert [field.name for field in table_summary.schema_] == ["id", "part", "value"]
+        assert table_summary.metadata.partition_columns == ["part"]
+
+    def test_last_commit_timestamp(self, table_summary, created_after):
+        """Test that the commit timestamp is taken from the table history."""
+        assert table_summary.last_commit_timestamp >= created_after
+        assert table_summary.last_optimize_timestamp is None
+        assert table_summary.last_vacuum_timestamp is None
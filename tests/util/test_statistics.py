@@ -0,0 +1,83 @@
+import pytest
+import polars as pl
+from delta_inspect.util.statistics import (
+    compute_all_metrics,
+    compute_discrete_distribution_metrics,
+    compute_discrete_histogram_metrics,
+    compute_distribution_metrics,
+    compute_histogram_metrics,
+    compute_value_counts,
+)
+
+
+class TestComputeDiscreteDistributionMetrics:
+    """Test the cumulative count based distribution metrics."""
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [0],
+            [0, 0, 0, 1],
+            [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5],
+            list(range(20)) + [0] * 7 + [128],
+        ],
+    )
+    def test_matches_distribution_metrics(self, values):
+        """Test that results are identical to the generic quantile computation."""
+        df = pl.DataFrame({"overlap_count": values})
+
+        expected = compute_distribution_metrics(df=df, column="overlap_count")
+        result = compute_discrete_distribution_metrics(df=df, column="overlap_count")
+
+        assert result == expected
+
+
+class TestComputeAllMetrics:
+    """Test the fused distribution and histogram metrics."""
+
+    def test_matches_separate_metrics(self):
+        """Test that results are identical to the separate computations."""
+        df = pl.DataFrame({"size": [-1.0, 0.5, 2.0, 2.5, 7.0, 12.0, 40.0]})
+        bins = [0, 2, 4, 8, 16]
+
+        metrics, hist = compute_all_metrics(df=df, column="size", bins=bins)
+
+        assert metrics == compute_distribution_metrics(df=df, column="size")
+        assert hist == compute_histogram_metrics(df=df, column="size", bins=bins)
+        assert hist.bins == [2.0, 4.0, 8.0, 16.0, 40.0]
+        assert hist.cnts == [3, 1, 1, 1, 1]
+
+
+class TestComputeHistogramMetrics:
+    """Test the histogram including values outside of the bins."""
+
+    def test_counts_each_value_once(self):
+        """Test that values on the highest bin edge are not counted as greater."""
+        df = pl.DataFrame({"overlap_count": [-1, 0, 2, 16, 17, 40]})
+
+        hist = compute_histogram_metrics(
+            df=df, column="overlap_count", bins=[0, 2, 4, 8, 16]
+        )
+
+        assert hist.cnts == [3, 0, 0, 1, 2]
+        assert sum(hist.cnts) == df.height
+
+
+class TestComputeDiscreteHistogramMetrics:
+    """Test the value counts based histogram."""
+
+    @pytest.mark.parametrize(
+        "values", [[0], [-1, 0, 2, 16, 17, 40], [0, 0, 1, 1, 1, 3, 5, 8, 8, 16, 33]]
+    )
+    def test_identical_to_histogram_metrics(self, values):
+        """Test that binning the value counts matches the polars histogram."""
+        df = pl.DataFrame({"overlap_count": values})
+        bins = [0, 1, 2, 4, 8, 16, 32]
+
+        expected = compute_histogram_metrics(df=df, column="overlap_count", bins=bins)
+        df_counts = compute_value_counts(df=df, column="overlap_count")
+        result = compute_discrete_histogram_metrics(
+            df_counts=df_counts, column="overlap_count", bins=bins
+        )
+
+        assert result == expected
@@ -1,41 +1,62 @@
+import shutil
+
 import pytest
 import polars as pl
-from deltalake import write_deltalake, DeltaTable
-from delta_inspect.util.table_loader import load_table
+from deltalake import ColumnProperties, WriterProperties, write_deltalake, DeltaTable
+from deltalake.exceptions import TableNotFoundError
+from delta_inspect.util.table_loader import get_add_actions, get_history, load_table
+
+
+# loader tests don't inspect column statistics, hence they are not written
+WRITER_PROPERTIES = WriterProperties(
+    default_column_properties=ColumnProperties(statistics_enabled="NONE")
+)
+
+# static table contents, written via the arrow stream interface of polars
+DF_SIMPLE = pl.DataFrame({
+    "id": [1, 2, 3],
+    "name": ["Alice", "Bob", "Charlie"],
+    "value": [100, 200, 300]
+})
+
+DF_INITIAL = pl.DataFrame({
+    "id": [1, 2, 3, 4],
+    "name": ["Alice", "Bob", "Charlie", "Diana"],
+    "value": [100, 200, 300, 400]
+})
+
+DF_APPENDED = pl.DataFrame({
+    "id": [5, 6],
+    "name": ["Eve", "Frank"],
+    "value": [500, 600]
+})
 
 
-@pytest.fixture
-def simple_delta_table(tmp_path):
+@pytest.fixture(scope="session")
+def simple_delta_table(tmp_path_factory):
     """Create a simple Delta table for testing."""
-    df = pl.DataFrame({
-        "id": [1, 2, 3],
-        "name": ["Alice", "Bob", "Charlie"],
-        "value": [100, 200, 300]
-    })
-    
-    write_deltalake(str(tmp_path), df.to_arrow(), mode="overwrite")
+    tmp_path = tmp_path_factory.mktemp("simple_delta_table")
+    write_deltalake(
+        str(tmp_path), DF_SIMPLE, mode="overwrite", writer_properties=WRITER_PROPERTIES
+    )
     return str(tmp_path)
 
 
-@pytest.fixture
-def delta_table_with_updates(tmp_path):
+@pytest.fixture(scope="session")
+def delta_table_with_updates(tmp_path_factory):
     """Create a Delta table with multiple versions."""
+    tmp_path = tmp_path_factory.mktemp("delta_table_with_updates")
+
     # Initial data (version 0)
-    df1 = pl.DataFrame({
-        "id": [1, 2, 3, 4],
-        "name": ["Alice", "Bob", "Charlie", "Diana"],
-        "value": [100, 200, 300, 400]
-    })
-    write_deltalake(str(tmp_path), df1.to_arrow(), mode="overwrite")
-    
+    write_deltalake(
+        str(tmp_path), DF_INITIAL, mode="overwrite", writer_properties=WRITER_PROPERTIES
+    )
+
     # Add more data (version 1)
-    df2 = pl.DataFrame({
-        "id": [5, 6],
-        "name": ["Eve", "Frank"],
-        "value": [500, 600]
-    })
-    write_deltalake(str(tmp_path), df2.to_arrow(), mode="append")
-    
+    write_deltalake(
+        str(tmp_path), DF_APPENDED, mode="append", writer_properties=WRITER_PROPERTIES
+    )
+
     return str(tmp_path)
 
 
@@ -47,15 +68,13 @@ class TestLoadTable:
         delta_table = load_table(simple_delta_table)
         assert isinstance(delta_table, DeltaTable)
     
-    def test_raises_error_for_invalid_path(self):
-        """Test that load_table raises an error for invalid paths."""
-        with pytest.raises(Exception):
-            load_table("nonexistent/path")
-    
-    def test_raises_error_for_non_delta_directory(self, tmp_path):
-        """Test that load_table raises an error for directories that aren't Delta tables."""
-        with pytest.raises(Exception):
-            load_table(str(tmp_path))
+    @pytest.mark.parametrize(
+        "subdir", ["nonexistent/path", ""], ids=["invalid_path", "non_delta_directory"]
+    )
+    def test_raises_error_for_non_delta_path(self, tmp_path, subdir):
+        """Test that load_table raises an error for paths that aren't Delta tables."""
+        with pytest.raises(TableNotFoundError):
+            load_table(str(tmp_path / subdir))
     
     def test_load_table_returns_consistent_results(self, simple_delta_table):
         """Test that loading the same table multiple times returns the same instance type."""
@@ -65,4 +84,45 @@ class TestLoadTable:
         # Both should be DeltaTable instances
         assert isinstance(table1, DeltaTable)
         assert isinstance(table2, DeltaTable)
-        assert table1.version() == table2.version()
\ No newline at end of file
+        assert table1.version() == table2.version()
+
+
+class TestTableCache:
+    """Test caching of tables and their Delta log."""
+
+    def test_load_table_sees_appended_version(self, tmp_path):
+        """Test that loading a table again reflects commits made in between."""
+        write_deltalake(str(tmp_path), DF_INITIAL, writer_properties=WRITER_PROPERTIES)
+        dt_before = load_table(str(tmp_path))
+        assert get_add_actions(dt_before).num_rows == 1
+
+        write_deltalake(
+            str(tmp_path), DF_APPENDED, mode="append", writer_properties=WRITER_PROPERTIES
+        )
+        dt_after = load_table(str(tmp_path))
+
+        assert dt_after.version() == dt_before.version() + 1
+        assert get_add_actions(dt_after).num_rows == 2
+        assert len(get_history(dt_after)) == 2
+
+    def test_add_actions_and_history_are_cached(self, delta_table_with_updates):
+        """Test that add actions and history are only read once per version."""
+        dt = load_table(delta_table_with_updates)
+
+        assert get_add_actions(dt) is get_add_actions(dt)
+        assert get_history(dt) is get_history(dt)
+        assert len(get_history(dt)) == 2
+
+    def test_recreated_table_is_not_served_from_cache(self, tmp_path):
+        """Test that a table recreated at the same path doesn't reuse its old log."""
+        write_deltalake(str(tmp_path), DF_SIMPLE, writer_properties=WRITER_PROPERTIES)
+        dt_old = load_table(str(tmp_path))
+        assert get_add_actions(dt_old)["num_records"][0].as_py() == 3
+
+        shutil.rmtree(tmp_path)
+        write_deltalake(str(tmp_path), DF_INITIAL, writer_properties=WRITER_PROPERTIES)
+        dt_new = load_table(str(tmp_path))
+
+        assert dt_new.version() == dt_old.version()
+        assert get_add_actions(dt_new)["num_records"][0].as_py() == 4
+        assert get_history(dt_new) is not get_history(dt_old)
@@ -0,0 +1,78 @@
+import datetime
+
+import polars as pl
+import pytest
+from delta_inspect.util.testing import ColumnType, TestDeltaTable
+
+
+SCHEMA = {"integer": ColumnType.INTEGER, "string": ColumnType.STRING}
+
+
+class TestGenerate:
+    """Test the generation of Delta Lake test data."""
+
+    def test_tuple_row_index(self, tmp_path):
+        """Test that values are derived from the row index within start and end."""
+        table = TestDeltaTable(path=tmp_path, row_index=(2, 5), null_count=0)
+
+        df = table.generate()
+
+        assert df["integer"].to_list() == [2, 3, 4]
+        assert df["float"].to_list() == [2.0, 3.0, 4.0]
+        assert df["string"].to_list() == ["string_2", "string_3", "string_4"]
+        assert df["date"][0] == datetime.date(2023, 1, 3)
+        assert df["timestamp"][-1] == datetime.datetime(2023, 1, 1, 4)
+
+    def test_int_null_count(self, tmp_path):
+        """Test that an int null count applies to all columns."""
+        table = TestDeltaTable(path=tmp_path, null_count=2)
+
+        df = table.generate()
+
+        assert df.height == 5
+        assert df.null_count().row(0) == (2,) * df.width
+
+    def test_dict_null_count(self, tmp_path):
+        """Test that a dict null count varies per column."""
+        table = TestDeltaTable(
+            path=tmp_path, schema_=SCHEMA, null_count={"integer": 0, "string": 3}
+        )
+
+        df = table.generate()
+
+        assert df["integer"].to_list() == [0, 1, 2, 3, 4]
+        assert df["string"].to_list() == [None, None, None, "string_3", "string_4"]
+
+    def test_replication(self, tmp_path):
+        """Test that rows are duplicated by the replication factor."""
+        table = TestDeltaTable(
+            path=tmp_path, schema_=SCHEMA, row_index=3, null_count=1, replication=2
+        )
+
+        df = table.generate()
+
+        assert df["integer"].to_list() == [None, 1, 2] * 3
+        assert df.schema == pl.Schema({"integer": pl.Int64, "string": pl.String})
+
+
+@pytest.mark.spark
+class TestWriteSpark:
+    """Test writing Delta Lake test tables with spark."""
+
+    def test_schema_types(self, tmp_path):
+        """Test that the spark table schema matches the generated columns."""
+        pytest.importorskip("pyspark")
+        pytest.importorskip("delta")
+        from pyspark.sql import types
+
+        table = TestDeltaTable(path=tmp_path, name=None)
+
+        dt = table._write_spark(table.generate())
+
+        assert {field.name: type(field.dataType) for field in dt.toDF().schema} == {
+            "integer": types.LongType,
+            "float": types.DoubleType,
+            "date": types.DateType,
+            "timestamp": types.TimestampType,
+            "string": types.StringType,
+        }